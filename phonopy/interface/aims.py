@@ -39,6 +39,7 @@
 # Modified 2020 by Florian Knoop
 
 import sys
+from itertools import islice
 import numpy as np
 from phonopy.structure.atoms import PhonopyAtoms as Atoms
 from phonopy.interface.vasp import check_forces, get_drift_forces
@@ -55,43 +56,44 @@ def lmap(func, lis):
 def read_aims(filename):
     """Method to read FHI-aims geometry files in phonopy context."""
 
-    lines = open(filename, "r").readlines()
-
-    cell = []
+    cell = np.zeros((3, 3), dtype='double')
+    num_lattice_vectors = 0
     is_frac = []
     positions = []
     symbols = []
     magmoms = []
-    for line in lines:
-        fields = line.split()
-        if not len(fields):
-            continue
-        if fields[0] == "lattice_vector":
-            vec = lmap(float, fields[1:4])
-            cell.append(vec)
-        elif fields[0][0:4] == "atom":
-            if fields[0] == "atom":
-                frac = False
-            elif fields[0] == "atom_frac":
-                frac = True
-            pos = lmap(float, fields[1:4])
-            sym = fields[4]
-            is_frac.append(frac)
-            positions.append(pos)
-            symbols.append(sym)
-            magmoms.append(None)
-        # implicitly assuming that initial_moments line adhere to FHI-aims geometry.in specification,
-        # i.e. two subsequent initial_moments lines do not occur
-        # if they do, the value specified in the last line is taken here - without any warning
-        elif fields[0] == "initial_moment":
-            magmoms[-1] = float(fields[1])
-
-    for (n, frac) in enumerate(is_frac):
-        if frac:
-            pos = [
-                sum([positions[n][l] * cell[l][i] for l in range(3)]) for i in range(3)
-            ]
-            positions[n] = pos
+    with open(filename, "r") as f:
+        for line in f:
+            fields = line.split()
+            if not len(fields):
+                continue
+            if fields[0] == "lattice_vector":
+                if num_lattice_vectors < 3:
+                    cell[num_lattice_vectors] = fields[1:4]
+                num_lattice_vectors += 1
+            elif fields[0][0:4] == "atom":
+                if fields[0] == "atom":
+                    frac = False
+                elif fields[0] == "atom_frac":
+                    frac = True
+                sym = fields[4]
+                is_frac.append(frac)
+                positions += fields[1:4]
+                symbols.append(sym)
+                magmoms.append(None)
+            # implicitly assuming that initial_moments line adhere to FHI-aims geometry.in specification,
+            # i.e. two subsequent initial_moments lines do not occur
+            # if they do, the value specified in the last line is taken here - without any warning
+            elif fields[0] == "initial_moment":
+                magmoms[-1] = float(fields[1])
+
+    if num_lattice_vectors != 3:
+        raise RuntimeError("Three lattice_vector lines are expected in %s."
+                           % filename)
+    positions = np.array(positions, dtype='double').reshape(-1, 3)
+    frac_mask = np.array(is_frac, dtype=bool)
+    if frac_mask.any():
+        positions[frac_mask] = np.dot(positions[frac_mask], cell)
     if None in magmoms:
         atoms = Atoms(cell=cell, symbols=symbols, positions=positions)
     else:
@@ -103,13 +105,12 @@ def read_aims(filename):
 def write_aims(filename, atoms):
     """Method to write FHI-aims geometry files in phonopy context."""
 
-    lines = ""
-    lines += "# geometry.in for FHI-aims \n"
-    lines += "# | generated by phonopy.FHIaims.write_aims() \n"
+    lines = ["# geometry.in for FHI-aims \n",
+             "# | generated by phonopy.FHIaims.write_aims() \n"]
 
     lattice_vector_line = "lattice_vector " + "%16.16f " * 3 + "\n"
     for vec in atoms.get_cell():
-        lines += lattice_vector_line % tuple(vec)
+        lines.append(lattice_vector_line % tuple(vec))
 
     N = atoms.get_number_of_atoms()
 
@@ -121,12 +122,12 @@ def write_aims(filename, atoms):
     magmoms = atoms.get_magnetic_moments()
 
     for n in range(N):
-        lines += atom_line % (tuple(positions[n]) + (symbols[n],))
+        lines.append(atom_line % (tuple(positions[n]) + (symbols[n],)))
         if magmoms is not None:
-            lines += initial_moment_line % magmoms[n]
+            lines.append(initial_moment_line % magmoms[n])
 
     with open(filename, "w") as f:
-        f.write(lines)
+        f.writelines(lines)
 
 
 class Atoms_with_forces(Atoms):
@@ -136,50 +137,37 @@ class Atoms_with_forces(Atoms):
         return self.forces
 
 
+def _read_block(f, num_lines, columns):
+    """Read the next num_lines lines of f into a (num_lines, 3) array"""
+    return np.array([line.split()[columns] for line in islice(f, num_lines)],
+                    dtype='double')
+
+
 def read_aims_output(filename):
     """ Read FHI-aims output and
         return geometry, energy and forces from last self-consistency iteration"""
 
-    lines = open(filename, "r").readlines()
-
-    l = 0
     N = 0
-    while l < len(lines):
-        line = lines[l]
-        if "| Number of atoms" in line:
-            N = int(line.split()[5])
-        elif "| Unit cell:" in line:
-            cell = []
-            for i in range(3):
-                l += 1
-                vec = lmap(float, lines[l].split()[1:4])
-                cell.append(vec)
-        elif ("Atomic structure:" in line) or ("Updated atomic structure:" in line):
-            if "Atomic structure:" in line:
-                i_sym = 3
-                i_pos_min = 4
-                i_pos_max = 7
-            elif "Updated atomic structure:" in line:
-                i_sym = 4
-                i_pos_min = 1
-                i_pos_max = 4
-            l += 1
-            symbols = []
-            positions = []
-            for n in range(N):
-                l += 1
-                fields = lines[l].split()
-                sym = fields[i_sym]
-                pos = lmap(float, fields[i_pos_min:i_pos_max])
-                symbols.append(sym)
-                positions.append(pos)
-        elif "Total atomic forces" in line:
-            forces = []
-            for i in range(N):
-                l += 1
-                force = lmap(float, lines[l].split()[-3:])
-                forces.append(force)
-        l += 1
+    with open(filename, "r") as f:
+        for line in f:
+            if "| Number of atoms" in line:
+                N = int(line.split()[5])
+            elif "| Unit cell:" in line:
+                cell = _read_block(f, 3, slice(1, 4))
+            elif ("Atomic structure:" in line) or ("Updated atomic structure:" in line):
+                if "Atomic structure:" in line:
+                    i_sym = 3
+                    i_pos = slice(4, 7)
+                elif "Updated atomic structure:" in line:
+                    i_sym = 4
+                    i_pos = slice(1, 4)
+                next(f)
+                fields = [l.split() for l in islice(f, N)]
+                symbols = [fs[i_sym] for fs in fields]
+                positions = np.array([fs[i_pos] for fs in fields],
+                                     dtype='double')
+            elif "Total atomic forces" in line:
+                forces = _read_block(f, N, slice(-3, None))
 
     atoms = Atoms_with_forces(cell=cell, symbols=symbols, positions=positions)
     atoms.forces = forces
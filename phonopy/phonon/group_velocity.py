@@ -125,6 +125,13 @@ class GroupVelocity(object):
         else:
             self._ddm = None
         self._symmetry = symmetry
+        if self._symmetry is None:
+            self._rotations_cartesian = None
+        else:
+            self._rotations_cartesian = np.array(
+                [similarity_transformation(self._reciprocal_lattice, r)
+                 for r in self._symmetry.get_reciprocal_operations()],
+                dtype='double', order='C')
         self._factor = frequency_factor_to_THz
         self._cutoff_frequency = cutoff_frequency
 
@@ -214,19 +221,15 @@ class GroupVelocity(object):
     def _symmetrize_group_velocity(self, gv, q):
         """Symmetrize obtained group velocities using site symmetries."""
 
-        rotations = []
-        for r in self._symmetry.get_reciprocal_operations():
-            q_in_BZ = q - np.rint(q)
-            diff = q_in_BZ - np.dot(r, q_in_BZ)
-            if (np.abs(diff) < self._symmetry.get_symmetry_tolerance()).all():
-                rotations.append(r)
-
-        gv_sym = np.zeros_like(gv)
-        for r in rotations:
-            r_cart = similarity_transformation(self._reciprocal_lattice, r)
-            gv_sym += np.dot(r_cart, gv.T).T
+        rotations = self._symmetry.get_reciprocal_operations()
+        q_in_BZ = q - np.rint(q)
+        diff = q_in_BZ - np.dot(rotations, q_in_BZ)
+        site_sym = (np.abs(diff) <
+                    self._symmetry.get_symmetry_tolerance()).all(axis=1)
+        r_cart_sum = self._rotations_cartesian[site_sym].sum(axis=0)
+        gv_sym = np.dot(gv, r_cart_sum.T)
 
-        return gv_sym / len(rotations)
+        return gv_sym / site_sym.sum()
 
     def _get_dD(self, q):
         """Compute derivative or finite difference of dynamcial matrices"""
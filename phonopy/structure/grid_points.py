@@ -375,9 +375,8 @@ class GridPoints(object):
          self._ir_weights) = extract_ir_grid_points(grid_mapping_table)
 
         shift = np.array(self._is_shift) * 0.5
-        self._ir_qpoints = np.array(
-            (self._grid_address[self._ir_grid_points] + shift) / self._mesh,
-            dtype='double', order='C')
+        self._ir_qpoints = self._grid_address[self._ir_grid_points] + shift
+        self._ir_qpoints /= self._mesh
 
         self._grid_mapping_table = grid_mapping_table
 
@@ -106,7 +106,7 @@ class SNF3x3(object):
         return self._attempt
 
     def next(self):
-        self.__next__()
+        return self.__next__()
 
     @property
     def A(self):
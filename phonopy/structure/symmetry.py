@@ -320,13 +320,11 @@ def get_pointgroup_operations(rotations, is_time_reversal=True):
 
 def collect_unique_rotations(rotations):
     ptg_ops = []
+    keys = set()
     for rot in rotations:
-        is_same = False
-        for tmp_rot in ptg_ops:
-            if (tmp_rot == rot).all():
-                is_same = True
-                break
-        if not is_same:
+        key = np.array(rot, dtype='intc').tobytes()
+        if key not in keys:
+            keys.add(key)
             ptg_ops.append(rot)
 
     return ptg_ops
@@ -0,0 +1,52 @@
+import unittest
+
+import numpy as np
+from phonopy.interface.phonopy_yaml import read_cell_yaml
+from phonopy.interface.aims import read_aims, read_aims_output
+import os
+
+data_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+class TestAims(unittest.TestCase):
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_read_aims(self):
+        cell = read_aims(os.path.join(data_dir, "NaCl-aims.in"))
+        filename = os.path.join(data_dir, "NaCl-castep.yaml")
+        cell_ref = read_cell_yaml(filename)
+        self.assertTrue(
+            (np.abs(cell.get_cell() - cell_ref.get_cell()) < 1e-5).all())
+        diff_pos = (cell.get_scaled_positions()
+                    - cell_ref.get_scaled_positions())
+        diff_pos -= np.rint(diff_pos)
+        self.assertTrue((np.abs(diff_pos) < 1e-5).all())
+        for s, s_r in zip(cell.get_chemical_symbols(),
+                          cell_ref.get_chemical_symbols()):
+            self.assertTrue(s == s_r)
+
+    def test_read_aims_output(self):
+        cell = read_aims_output(os.path.join(data_dir, "Si-aims.out"))
+        lattice_ref = [[0, 2.71535, 2.71535],
+                       [2.71535, 0, 2.71535],
+                       [2.71535, 2.71535, 0]]
+        positions_ref = [[0.01, 0, 0],
+                         [1.357675, 1.357675, 1.357675]]
+        forces_ref = [[-0.0123456789, 0.002, -0.003],
+                      [0.0123456789, -0.002, 0.003]]
+        self.assertTrue(
+            (np.abs(cell.get_cell() - lattice_ref) < 1e-5).all())
+        self.assertTrue(
+            (np.abs(cell.get_positions() - positions_ref) < 1e-5).all())
+        self.assertTrue((np.abs(cell.forces - forces_ref) < 1e-8).all())
+        self.assertEqual(cell.get_chemical_symbols(), ['Si', 'Si'])
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestAims)
+    unittest.TextTestRunner(verbosity=2).run(suite)